@@ -8,10 +8,13 @@
 """Check installed modules and settings to provide lists of middlewares/installed apps."""
 import os
 import sys
+from functools import partial
 
 from django.core.checks import Warning
 
 settings_check_results = []
+# all warnings emitted while reading settings are attached to the configuration
+configuration_warning = partial(Warning, obj="configuration")
 
 
 def missing_package(package_name, desc=""):
@@ -22,9 +25,8 @@ def missing_package(package_name, desc=""):
         cmd = f"Try 'python3 -m pip install --user {package_name}' to install it."
     else:
         cmd = f"Try 'sudo python3 -m pip install {package_name}' to install it."
-    return Warning(
+    return configuration_warning(
         f"Python package '{package_name}' is required{desc}.",
-        obj="configuration",
         hint=cmd,
         id="df_config.W001",
     )
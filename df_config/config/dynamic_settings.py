@@ -41,10 +41,9 @@ import sys
 from collections import OrderedDict
 from typing import Any, Set
 
-from django.core.checks import Warning
 from django.utils.module_loading import import_string
 
-from df_config.checks import settings_check_results
+from df_config.checks import configuration_warning, settings_check_results
 
 
 class DynamicSettting:
@@ -54,6 +53,8 @@ class DynamicSettting:
       then the method `get_value(merger)` is called for getting the definitive value.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: Any):
         """Initialize the object."""
         self.value = value
@@ -112,9 +113,8 @@ class DynamicSettting:
         ):
             return
         settings_check_results.append(
-            Warning(
+            configuration_warning(
                 msg,
-                obj="configuration",
                 id="df_config.W002",
             )
         )
@@ -273,9 +273,8 @@ class File(Path):
         value = os.path.normpath(value)
         if not os.path.isfile(value):
             settings_check_results.append(
-                Warning(
+                configuration_warning(
                     f"'{value}' does not exist.",
-                    obj="configuration",
                     id="df_config.W003",
                 )
             )
@@ -449,9 +448,8 @@ class AutocreateFile(AutocreateFileContent):
         filename = merger.analyze_raw_value(self.value, provider_name, setting_name)
         if not os.path.isfile(filename):
             settings_check_results.append(
-                Warning(
+                configuration_warning(
                     f"'{filename}' does not exist. Run the 'migrate' command to fix this problem.",
-                    obj="configuration",
                     id="df_config.W004",
                 )
             )
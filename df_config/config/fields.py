@@ -21,18 +21,26 @@ Check :mod:`df_config.iniconf` for examples.
 """
 
 import os
+import re
 from typing import Any, Callable, Optional, Union
 
-from django.core.checks import Error, Warning
+from django.core.checks import Error
 
-from df_config.checks import settings_check_results
+from df_config.checks import configuration_warning, settings_check_results
 
 MISSING_VALUE = [[]]
+TRUE_VALUES = frozenset({"1", "ok", "yes", "true", "on"})
+_split_re = re.compile(r"\s*,\s*")
 
 
 def bool_setting(value):
     """Return `True` if the provided (lower-cased) text is one of {'1', 'ok', 'yes', 'true', 'on'}."""
-    return str(value).lower() in {"1", "ok", "yes", "true", "on"}
+    if value is True:
+        return True
+    elif value is False or value is None:
+        return False
+    text = value if type(value) is str else str(value)
+    return text.lower() in TRUE_VALUES
 
 
 def str_or_none(text):
@@ -45,14 +53,64 @@ def str_or_blank(value):
     return "" if value is None else str(value)
 
 
+def int_or_none(value: str) -> Optional[int]:
+    """Return `None` if the text is empty, else convert it to an integer."""
+    return int(value) if value else None
+
+
+def int_or_zero(value: str) -> int:
+    """Return `0` if the text is empty, else convert it to an integer."""
+    return int(value) if value else 0
+
+
+def float_or_none(value: str) -> Optional[float]:
+    """Return `None` if the text is empty, else convert it to a float."""
+    return float(value) if value else None
+
+
+def float_or_zero(value: str) -> float:
+    """Return `0.0` if the text is empty, else convert it to a float."""
+    return float(value) if value else 0.0
+
+
+def bool_or_none(value: str) -> Optional[bool]:
+    """Return `None` if the text is empty, else convert it with :func:`bool_setting`."""
+    if not value:
+        return None
+    return bool_setting(value)
+
+
+def bool_to_str(value) -> str:
+    """Return "true" or "false"."""
+    return str(bool(value)).lower()
+
+
+def bool_or_none_to_str(value) -> str:
+    """Return "" if the value is `None`, else "true" or "false"."""
+    if value is None:
+        return ""
+    return str(bool(value)).lower()
+
+
+def list_to_str(value) -> str:
+    """Join all values with ","."""
+    if value:
+        return ",".join([str(x) for x in value])
+    return ""
+
+
 def guess_relative_path(value):
     """Replace an absolute path by its relative path if the abspath begins by the current dir."""
     if not value:
         return ""
-    value = os.path.abspath(value)
     cwd = os.getcwd()
-    if value.startswith(cwd):
-        return ".%s" % (value[len(cwd) :])
+    value = os.path.normpath(os.path.join(cwd, value))
+    if value == cwd:
+        return "."
+    # do not match "/home/foobar" when the current directory is "/home/foo"
+    prefix = cwd if cwd.endswith(os.sep) else cwd + os.sep
+    if value.startswith(prefix):
+        return "." + os.sep + value[len(prefix) :]
     return value
 
 
@@ -68,9 +126,8 @@ def str_to_filepath(value: Optional[str]) -> Optional[str]:
         value = os.path.abspath(value.strip())
         if not os.path.isfile(value):
             settings_check_results.append(
-                Warning(
+                configuration_warning(
                     f'File "{value}" is not a file.',
-                    obj="configuration",
                     id="df_config.W002",
                 )
             )
@@ -90,9 +147,8 @@ def str_to_directory_path(value: Optional[str]) -> Optional[str]:
         value = os.path.abspath(value.strip())
         if not os.path.isdir(value):
             settings_check_results.append(
-                Warning(
+                configuration_warning(
                     f'File "{value}" is not a directory.',
-                    obj="configuration",
                     id="df_config.W002",
                 )
             )
@@ -117,9 +173,9 @@ def strip_split(value):
     :return: a list of strings
     :rtype: :class:`list`
     """
-    if value:
-        return [x.strip() for x in value.split(",") if x.strip()]
-    return []
+    if not value:
+        return []
+    return [x for x in _split_re.split(value.strip()) if x]
 
 
 class ConfigField:
@@ -182,16 +238,7 @@ class IntegerConfigField(ConfigField):
 
     def __init__(self, name, setting_name, allow_none=True, **kwargs):
         """Create a new field that only accepts an integer value."""
-        if allow_none:
-
-            def from_str(value: str):
-                return int(value) if value else None
-
-        else:
-
-            def from_str(value: str):
-                return int(value) if value else 0
-
+        from_str = int_or_none if allow_none else int_or_zero
         super().__init__(
             name, setting_name, from_str=from_str, to_str=str_or_blank, **kwargs
         )
@@ -202,16 +249,7 @@ class FloatConfigField(ConfigField):
 
     def __init__(self, name, setting_name, allow_none=True, **kwargs):
         """Create a new field that only accepts a floating-point value."""
-        if allow_none:
-
-            def from_str(value):
-                return float(value) if value else None
-
-        else:
-
-            def from_str(value):
-                return float(value) if value else 0.0
-
+        from_str = float_or_none if allow_none else float_or_zero
         super().__init__(
             name, setting_name, from_str=from_str, to_str=str_or_blank, **kwargs
         )
@@ -222,14 +260,8 @@ class ListConfigField(ConfigField):
 
     def __init__(self, name, setting_name, **kwargs):
         """Create a new field that only accepts a list of values."""
-
-        def to_str(value):
-            if value:
-                return ",".join([str(x) for x in value])
-            return ""
-
         super().__init__(
-            name, setting_name, from_str=strip_split, to_str=to_str, **kwargs
+            name, setting_name, from_str=strip_split, to_str=list_to_str, **kwargs
         )
 
 
@@ -243,25 +275,9 @@ class BooleanConfigField(ConfigField):
     def __init__(self, name, setting_name, allow_none=False, **kwargs):
         """Create a new field that only accepts a boolean value."""
         if allow_none:
-
-            def from_str(value):
-                if not value:
-                    return None
-                return bool_setting(value)
-
-            def to_str(value):
-                if value is None:
-                    return ""
-                return str(bool(value)).lower()
-
+            from_str, to_str = bool_or_none, bool_or_none_to_str
         else:
-
-            def from_str(value):
-                return bool_setting(value)
-
-            def to_str(value):
-                return str(bool(value)).lower()
-
+            from_str, to_str = bool_setting, bool_to_str
         super().__init__(name, setting_name, from_str=from_str, to_str=to_str, **kwargs)
 
 
@@ -278,13 +294,20 @@ class ChoiceConfigFile(ConfigField):
 
     def __init__(self, name, setting_name, choices, help_str="", **kwargs):
         """Create a new field that only accepts a limited set of values."""
+        valid_values = ", ".join([f'"{x}"' for x in choices])
+        # reverse mapping for to_str, keeping the first key for duplicate values
+        inverse = {}
+        try:
+            for k, v in choices.items():
+                inverse.setdefault(v, str(k))
+        except TypeError:  # unhashable values
+            inverse = None
 
         def from_str(value):
             if value not in choices:
-                valid = ", ".join([f'"{x}"' for x in choices])
                 settings_check_results.append(
                     Error(
-                        f'Invalid value "{value}". Valid choices: {valid}.',
+                        f'Invalid value "{value}". Valid choices: {valid_values}.',
                         obj="configuration",
                         id="df_config.E002",
                     )
@@ -292,12 +315,16 @@ class ChoiceConfigFile(ConfigField):
             return choices.get(value)
 
         def to_str(value):
+            if inverse is not None:
+                try:
+                    return inverse.get(value, "")
+                except TypeError:  # unhashable value
+                    pass
             for k, v in choices.items():
                 if v == value:
                     return str(k)
             return ""
 
-        valid_values = ", ".join(['"%s"' % x for x in choices])
         if help_str:
             help_str += f" Valid choices: {valid_values}"
         else:
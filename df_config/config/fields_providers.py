@@ -13,23 +13,36 @@
 #  or https://cecill.info/licences/Licence_CeCILL-B_V1-fr.txt (French)         #
 #                                                                              #
 # ##############################################################################
+from functools import lru_cache
 from importlib import import_module
 from typing import Any, List, Optional, Tuple
 
 from df_config.config.fields import ConfigField
 
 
-def import_attribute(value: str, default=None) -> Tuple[Optional[Any], bool]:
-    if value is None:
-        return default, False
+@lru_cache(maxsize=None)
+def load_attribute(value: str) -> Tuple[Optional[Any], bool]:
+    """Import "module.name:attribute" only once and return (attribute, True), or (None, False) if not found.
+
+    Call `load_attribute.cache_clear()` to import attributes again.
+    """
     module_name, sep, attribute_name = value.partition(":")
     try:
         module = import_module(module_name, package=None)
         return getattr(module, attribute_name), True
     except AttributeError:
-        return default, False
+        return None, False
     except ImportError:
+        return None, False
+
+
+def import_attribute(value: str, default=None) -> Tuple[Optional[Any], bool]:
+    if value is None:
+        return default, False
+    attribute, found = load_attribute(value)
+    if not found:
         return default, False
+    return attribute, True
 
 
 class ConfigFieldsProvider:
@@ -55,17 +68,29 @@ class PythonConfigFieldsProvider(ConfigFieldsProvider):
 
     def __init__(self, value=None, fallback=None):
         self.attribute_name = value or "df_config.iniconf:EMPTY_INI_MAPPING"
+        self.fallback = fallback
+        self.mapping, self.valid = [], False
+        self._loaded = False
+
+    def load(self):
+        """Import the attribute (or the fallback one) on first use."""
+        if self._loaded:
+            return
+        self._loaded = True
         self.mapping, self.valid = import_attribute(self.attribute_name, [])
-        if not self.valid and fallback:
-            self.attribute_name = fallback
+        if not self.valid and self.fallback:
+            self.attribute_name = self.fallback
             self.mapping, self.valid = import_attribute(self.attribute_name, [])
 
     def is_valid(self) -> bool:
+        self.load()
         return self.valid
 
     def get_config_fields(self):
         """Return the list that is defined in the module by the attribute name"""
+        self.load()
         return self.mapping
 
     def __str__(self):
+        self.load()
         return self.attribute_name
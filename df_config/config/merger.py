@@ -16,8 +16,8 @@
 """Merger object, that analyzes all Django settings and merges them."""
 import string
 import sys
-from collections import OrderedDict
-from typing import Any
+from functools import lru_cache
+from typing import Any, Tuple
 
 from django.core.management import color_style
 from django.core.management.base import OutputWrapper
@@ -28,6 +28,22 @@ from df_config.config.fields import ConfigField
 from df_config.config.fields_providers import PythonConfigFieldsProvider
 from df_config.config.values_providers import ConfigProvider
 
+_formatter = string.Formatter()
+
+
+@lru_cache(maxsize=1024)
+def get_field_names(text: str) -> Tuple[str, ...]:
+    """Return the names of the settings that are referenced in a formatted string.
+
+    >>> get_field_names("{X}/{Y!r:>10}/{{Z}}")
+    ('X', 'Y')
+    """
+    return tuple(
+        field_name
+        for literal_text, field_name, format_spec, conversion in _formatter.parse(text)
+        if field_name is not None
+    )
+
 
 class SettingMerger:
     """Load different settings modules and config files and merge them."""
@@ -43,12 +59,12 @@ class SettingMerger:
         """Initialize the internal objects."""
         self.fields_provider = fields_provider or PythonConfigFieldsProvider(None)
         self.providers = providers or []
-        self.__formatter = string.Formatter()
         self.settings = {}
         self.config_values = (
             []
         )  # list of (ConfigValue, provider_name, setting_name, final_value)
-        self.raw_settings = OrderedDict()
+        self.raw_settings = {}
+        self._sorted_fields = None  # config fields sorted by name, for write_provider
         # raw_settings[setting_name][str(provider) or None] = raw_value
         self.__working_stack = set()
         self.stdout = OutputWrapper(stdout or sys.stdout)
@@ -70,35 +86,32 @@ class SettingMerger:
 
     def load_raw_settings(self):
         """Load all raw settings, without analyzing them (just fetch their names)."""
+        fields = list(self.fields_provider.get_config_fields())
+        assert all(isinstance(field, ConfigField) for field in fields)
+        assert all(isinstance(provider, ConfigProvider) for provider in self.providers)
+        # extra settings are read only once, since they are used twice
+        extra_settings = [
+            list(provider.get_extra_settings()) for provider in self.providers
+        ]
         # get all setting names and sort them
-        all_settings_names_set = set()
-        for field in self.fields_provider.get_config_fields():
-            assert isinstance(field, ConfigField)
-            all_settings_names_set.add(field.setting_name)
-        for provider in self.providers:
-            assert isinstance(provider, ConfigProvider)
-            for setting_name, value in provider.get_extra_settings():
-                all_settings_names_set.add(setting_name)
-        all_settings_names = list(sorted(all_settings_names_set))
+        all_settings_names = {field.setting_name for field in fields}
+        for provider_extra_settings in extra_settings:
+            all_settings_names.update(name for name, value in provider_extra_settings)
+        raw_settings = self.raw_settings
         # initialize all defined settings
-        for setting_name in all_settings_names:
-            self.raw_settings[setting_name] = OrderedDict()
+        for setting_name in sorted(all_settings_names):
+            raw_settings[setting_name] = {}
         # fetch default values if its exists (useless?)
-        for field in self.fields_provider.get_config_fields():
-            assert isinstance(field, ConfigField)
-            self.raw_settings[field.setting_name][None] = field.value
+        for field in fields:
+            raw_settings[field.setting_name][None] = field.value
         # read all providers (in the right order)
-        for provider in self.providers:
-            assert isinstance(provider, ConfigProvider)
+        for provider, provider_extra_settings in zip(self.providers, extra_settings):
             source_name = str(provider)
-            for field in self.fields_provider.get_config_fields():
-                assert isinstance(field, ConfigField)
-                if provider.has_value(field):
-                    value = provider.get_value(field)
-                    # noinspection PyTypeChecker
-                    self.raw_settings[field.setting_name][source_name] = value
-            for setting_name, value in provider.get_extra_settings():
-                self.raw_settings[setting_name][source_name] = value
+            for field, value in provider.get_values(fields).items():
+                # noinspection PyTypeChecker
+                raw_settings[field.setting_name][source_name] = value
+            for setting_name, value in provider_extra_settings:
+                raw_settings[setting_name][source_name] = value
 
     def has_setting_value(self, setting_name):
         """Return True if the setting exists."""
@@ -115,9 +128,10 @@ class SettingMerger:
         elif setting_name not in self.raw_settings:
             raise ValueError("Invalid setting reference: %s" % setting_name)
         self.__working_stack.add(setting_name)
-        provider_name, raw_value = None, None
-        for provider_name, raw_value in self.raw_settings[setting_name].items():
-            pass
+        # the last provider that defines this setting wins
+        provider_name, raw_value = next(
+            reversed(self.raw_settings[setting_name].items()), (None, None)
+        )
         value = self.analyze_raw_value(raw_value, provider_name, setting_name)
         self.settings[setting_name] = value
         self.__working_stack.remove(setting_name)
@@ -164,60 +178,89 @@ class SettingMerger:
         if hasattr(obj, "_wrapped"):
             # this is a Django LazyObject
             return obj
-        elif isinstance(obj, str):
-            values = {}
-            for (
-                literal_text,
-                field_name,
-                format_spec,
-                conversion,
-            ) in self.__formatter.parse(obj):
-                if field_name is not None:
-                    values[field_name] = self.get_setting_value(field_name)
-            return self.__formatter.format(obj, **values)
-        elif isinstance(obj, DynamicSettting):
-            final_value = obj.get_value(self, provider_name, setting_name)
-            self.config_values.append((obj, provider_name, setting_name, final_value))
-            return final_value
-        elif isinstance(obj, list) or isinstance(obj, tuple):
-            result = []
-            for sub_obj in obj:
-                if isinstance(sub_obj, ExpandIterable):
-                    result += self.get_setting_value(sub_obj.value)
-                else:
-                    result.append(
-                        self.analyze_raw_value(sub_obj, provider_name, setting_name)
-                    )
-            if isinstance(obj, tuple):
-                return tuple(result)
-            return result
-        elif isinstance(obj, set):
-            result = set()
-            for sub_obj in obj:
-                if isinstance(sub_obj, ExpandIterable):
-                    result |= self.get_setting_value(sub_obj.value)
-                else:
-                    result.add(
-                        self.analyze_raw_value(sub_obj, provider_name, setting_name)
-                    )
-            return result
-        elif isinstance(obj, dict):
-            result = {}  # OrderedDict or plain dict
-            for sub_key, sub_obj in obj.items():
-                if isinstance(sub_obj, ExpandIterable):
-                    result.update(self.get_setting_value(sub_obj.value))
-                else:
-                    value = self.analyze_raw_value(sub_obj, provider_name, setting_name)
-                    key = self.analyze_raw_value(sub_key, provider_name, setting_name)
-                    result[key] = value
-            # to work with OrderedDict and defaultdict, we need to use the provided object and not a new one
-            to_remove = [key for key in obj if key not in result]
-            for key in to_remove:
-                del obj[key]
-            obj.update(result)
+        obj_type = type(obj)
+        analyzer = self._analyzers.get(obj_type)
+        if analyzer is None:
+            # subclass of a known type (OrderedDict, DynamicSetting, ...) or unknown type
+            analyzer = SettingMerger._analyze_other
+            for base_type, base_analyzer in self._analyzers_by_base:
+                if isinstance(obj, base_type):
+                    analyzer = base_analyzer
+                    break
+            self._analyzers[obj_type] = analyzer
+        return analyzer(self, obj, provider_name, setting_name)
+
+    def _analyze_str(self, obj: str, provider_name: str, setting_name: str) -> str:
+        if "{" not in obj and "}" not in obj:
+            # most strings are not formatted: avoid parsing them
             return obj
+        values = {
+            field_name: self.get_setting_value(field_name)
+            for field_name in get_field_names(obj)
+        }
+        return obj.format_map(values)
+
+    def _analyze_dynamic_setting(
+        self, obj: DynamicSettting, provider_name: str, setting_name: str
+    ) -> Any:
+        final_value = obj.get_value(self, provider_name, setting_name)
+        self.config_values.append((obj, provider_name, setting_name, final_value))
+        return final_value
+
+    def _analyze_list(self, obj, provider_name: str, setting_name: str) -> list:
+        result = []
+        for sub_obj in obj:
+            if isinstance(sub_obj, ExpandIterable):
+                result += self.get_setting_value(sub_obj.value)
+            else:
+                result.append(
+                    self.analyze_raw_value(sub_obj, provider_name, setting_name)
+                )
+        return result
+
+    def _analyze_tuple(self, obj: tuple, provider_name: str, setting_name: str):
+        return tuple(self._analyze_list(obj, provider_name, setting_name))
+
+    def _analyze_set(self, obj: set, provider_name: str, setting_name: str) -> set:
+        result = set()
+        for sub_obj in obj:
+            if isinstance(sub_obj, ExpandIterable):
+                result |= self.get_setting_value(sub_obj.value)
+            else:
+                result.add(self.analyze_raw_value(sub_obj, provider_name, setting_name))
+        return result
+
+    def _analyze_dict(self, obj: dict, provider_name: str, setting_name: str) -> dict:
+        result = {}
+        for sub_key, sub_obj in obj.items():
+            if isinstance(sub_obj, ExpandIterable):
+                result.update(self.get_setting_value(sub_obj.value))
+            else:
+                value = self.analyze_raw_value(sub_obj, provider_name, setting_name)
+                key = self.analyze_raw_value(sub_key, provider_name, setting_name)
+                result[key] = value
+        # to work with OrderedDict and defaultdict, we need to use the provided object and not a new one
+        # it is only modified once all values are analyzed, so it is left unchanged on error
+        obj.clear()
+        obj.update(result)
         return obj
 
+    # noinspection PyUnusedLocal
+    def _analyze_other(self, obj: Any, provider_name: str, setting_name: str) -> Any:
+        return obj
+
+    # the order matters when looking for the analyzer of a subclass
+    _analyzers_by_base = (
+        (str, _analyze_str),
+        (DynamicSettting, _analyze_dynamic_setting),
+        (list, _analyze_list),
+        (tuple, _analyze_tuple),
+        (set, _analyze_set),
+        (dict, _analyze_dict),
+    )
+    # exact type -> analyzer, completed on the fly with encountered subclasses
+    _analyzers = dict(_analyzers_by_base)
+
     def post_process(self):
         """Perform some cleaning on settings.
 
@@ -225,13 +268,18 @@ class SettingMerger:
         """
         # remove duplicates in INSTALLED_APPS
         key = "INSTALLED_APPS"
-        if key in self.settings:
-            self.settings[key] = list(OrderedDict.fromkeys(self.settings[key]))
+        apps = self.settings.get(key)
+        if apps and len(apps) != len(set(apps)):
+            self.settings[key] = list(dict.fromkeys(apps))
 
     def write_provider(self, provider, include_doc=False):
         """Write settings to the given provider."""
-        config_fields = self.fields_provider.get_config_fields()
-        for config_field in sorted(config_fields, key=lambda x: str(x.name)):
+        if self._sorted_fields is None:
+            self._sorted_fields = sorted(
+                self.fields_provider.get_config_fields(),
+                key=lambda x: x.name or x.setting_name,
+            )
+        for config_field in self._sorted_fields:
             assert isinstance(config_field, ConfigField)
             if config_field.setting_name not in self.settings:
                 continue
@@ -1,40 +1,112 @@
 """Allow to create different dynamic settings from a single URL."""
 
 import re
+import sys
 import urllib.parse
-from importlib.metadata import PackageNotFoundError, version
-from typing import Callable, Dict, List, Optional, Tuple, Union
-from urllib.parse import ParseResult
+from functools import lru_cache
+from importlib.metadata import distributions
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple, Union
+from urllib.parse import SplitResult
 
 from django.core.exceptions import ImproperlyConfigured
-from setuptools.command.bdist_egg import can_scan
 
+from df_config.checks import missing_package, settings_check_results
 from df_config.config.dynamic_settings import DynamicSettting
 
+SSL_MODES = frozenset(
+    {"disable", "allow", "prefer", "require", "verify-ca", "verify-full"}
+)
+SECURE_SSL_MODES = frozenset({"require", "verify-ca", "verify-full"})
+_distribution_name_re = re.compile(r"[-_.]+")
+_empty_query = MappingProxyType({})
+
+
+def normalize_distribution_name(name: str) -> str:
+    """Normalize a distribution name, as described in PEP 503.
+
+    >>> normalize_distribution_name("Django_Allauth")
+    'django-allauth'
+    """
+    return _distribution_name_re.sub("-", name).lower()
+
+
+@lru_cache(maxsize=1)
+def installed_distributions() -> FrozenSet[str]:
+    """Return the normalized names of all installed distributions."""
+    names = (x.metadata["Name"] for x in distributions())
+    return frozenset(normalize_distribution_name(x) for x in names if x)
+
+
+@lru_cache(maxsize=256)
+def parse_url(
+    value: str, split_char: str
+) -> Tuple[Tuple[SplitResult, ...], Mapping[str, Tuple[str, ...]]]:
+    """Parse a URL string, splitting its netloc into several URLs if required.
+
+    Results are shared between calls, so they are returned as read-only objects.
+
+    >>> urls, query = parse_url("psql://localhost,localhost:5433/db?ssl=true", ",")
+    >>> [x.netloc for x in urls]
+    ['localhost', 'localhost:5433']
+    >>> query["ssl"]
+    ('true',)
+    """
+    parsed_url = urllib.parse.urlsplit(value)
+    if split_char and split_char in parsed_url.netloc:
+        parsed_urls = tuple(
+            parsed_url._replace(netloc=x) for x in parsed_url.netloc.split(split_char)
+        )
+    else:
+        parsed_urls = (parsed_url,)
+    if not parsed_url.query:
+        return parsed_urls, _empty_query
+    parsed_query = {
+        k: tuple(v) for k, v in urllib.parse.parse_qs(parsed_url.query).items()
+    }
+    return parsed_urls, MappingProxyType(parsed_query)
+
 
 class Attribute(DynamicSettting):
     """Dynamic setting which is an attribute of a URL string."""
 
+    __slots__ = ("url_setting", "default")
+
     def __init__(
         self,
         url_setting,
-        attribute: Callable[[], Optional[Union[str, bool]]],
+        attribute: Callable[["URLSetting"], Optional[Union[str, bool]]],
         default=None,
     ):
-        """Initialize the object."""
+        """Initialize the object.
+
+        :param url_setting: the URL setting this attribute is extracted from
+        :param attribute: unbound method of the URL setting class returning the attribute
+        :param default: value used when the URL setting is empty
+        """
         super().__init__(attribute)
         self.url_setting: URLSetting = url_setting
         self.default = default
 
     def get_value(self, merger, provider_name: str, setting_name: str):
         """Get the final value of the attribute."""
-        self.url_setting.load(merger)
-        if self.url_setting.parsed_urls:
-            value = self.value()
+        url_setting = self.url_setting
+        if not url_setting._loaded and url_setting.setting_name:
+            url_setting.load(merger)
+        if url_setting.parsed_urls:
+            value = self.value(url_setting)
         else:
             value = self.default
         return merger.analyze_raw_value(value, provider_name, setting_name)
 
+    def __eq__(self, other):
+        """Compare the equality between two attributes."""
+        return (
+            isinstance(other, self.__class__)
+            and other.url_setting is self.url_setting
+            and other.value == self.value
+        )
+
     def __repr__(self):
         """Represent this object as a string."""
         method = self.value.__name__[:-1]
@@ -48,28 +120,91 @@ class Attribute(DynamicSettting):
 class URLSetting:
     """Represents a URL setting, such that each URL component can be used as a DynamicSetting."""
 
-    ENGINES = {}
-    REQUIREMENTS = {}
-    SCHEME_ALIASES = {}
+    __slots__ = (
+        "split_char",
+        "_url_str",
+        "parsed_urls",
+        "parsed_query",
+        "_loaded",
+        "setting_name",
+        "required",
+        "_scheme",
+        "_netloc",
+        "_hostname",
+        "_default_port",
+        "_path",
+        "_params",
+        "_query",
+        "_username",
+        "_password",
+        "_use_ssl",
+        "_ssl_mode",
+        "_use_tls",
+    )
+    ENGINES: Mapping[str, str] = MappingProxyType({})
+    REQUIREMENTS: Mapping[str, Tuple[str, ...]] = MappingProxyType({})
+    SCHEME_ALIASES: Mapping[str, str] = MappingProxyType({})
     # noinspection SpellCheckingInspection
-    SCHEMES: Dict[str, Tuple[int, bool, bool]] = {
-        "amqp": (5672, False, False),
-        "file": (None, False, False),
-        "http": (80, False, False),
-        "https": (443, True, False),
-        "memcache": (11211, False, False),
-        "mariadb": (3306, False, False),
-        "mysql": (3306, False, False),
-        "oracle": (1521, False, False),
-        "postgres": (5432, False, False),
-        "redis": (6379, False, False),
-        "rediss": (6379, True, False),
-        "smtp": (25, False, False),
-        "smtp+tls": (487, False, True),
-        "smtps": (465, True, False),
-        "sqlite": (None, False, False),
-        "sqlite3": (None, False, False),
-    }  # (port, SSL ?, StartTLS ?)
+    SCHEMES: Mapping[str, Tuple[Optional[int], bool, bool]] = MappingProxyType(
+        {
+            "amqp": (5672, False, False),
+            "file": (None, False, False),
+            "http": (80, False, False),
+            "https": (443, True, False),
+            "memcache": (11211, False, False),
+            "mariadb": (3306, False, False),
+            "mysql": (3306, False, False),
+            "oracle": (1521, False, False),
+            "postgres": (5432, False, False),
+            "redis": (6379, False, False),
+            "rediss": (6379, True, False),
+            "smtp": (25, False, False),
+            "smtp+tls": (487, False, True),
+            "smtps": (465, True, False),
+            "sqlite": (None, False, False),
+            "sqlite3": (None, False, False),
+        }
+    )  # (port, SSL ?, StartTLS ?)
+    # scheme or alias -> (canonical scheme, port, SSL ?, StartTLS ?), built for each class
+    _scheme_table: Dict[str, Tuple[str, Optional[int], bool, bool]] = {}
+    # installed packages do not change, so engines are only checked once per class
+    _engine_resolved: Dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Build the scheme table and the engine cache of the new class."""
+        super().__init_subclass__(**kwargs)
+        cls._scheme_table = cls.build_scheme_table()
+        cls._engine_resolved = {}
+
+    @classmethod
+    def build_scheme_table(cls) -> Dict[str, Tuple[str, Optional[int], bool, bool]]:
+        """Merge SCHEMES and SCHEME_ALIASES into a single lookup table."""
+        table = {s: (sys.intern(s), *v) for (s, v) in cls.SCHEMES.items()}
+        for alias, scheme in cls.SCHEME_ALIASES.items():
+            scheme = sys.intern(scheme)
+            table[alias] = (scheme, *cls.SCHEMES.get(scheme, (None, False, False)))
+        return table
+
+    @classmethod
+    def lookup_scheme(cls, scheme: str) -> Tuple[str, Optional[int], bool, bool]:
+        """Return the canonical scheme, its default port, and its SSL and StartTLS flags.
+
+        Schemes are already lowercased by urlsplit, so only unknown schemes are lowercased again.
+
+        >>> DatabaseURL.lookup_scheme("PSQL")
+        ('postgres', 5432, False, False)
+        """
+        try:
+            return cls._scheme_table[scheme]
+        except KeyError:
+            pass
+        if scheme.islower():
+            return scheme, None, False, False
+        scheme = scheme.lower()
+        try:
+            return cls._scheme_table[scheme]
+        except KeyError:
+            return scheme, None, False, False
 
     def __init__(
         self,
@@ -87,12 +222,12 @@ class URLSetting:
         """
         self.split_char: Optional[str] = split_char
         self._url_str: Optional[str] = None
-        self.parsed_urls: Optional[List[ParseResult]] = None
-        self.parsed_query: Optional[Dict[str, str]] = None
+        self.parsed_urls: Optional[Tuple[SplitResult, ...]] = None
+        self.parsed_query: Optional[Mapping[str, Tuple[str, ...]]] = None
         self._loaded: bool = False
         self.parse_value(url)
         self.setting_name = setting_name
-        self.required = required or []
+        self.required: Tuple[str, ...] = tuple(required) if required else ()
 
     def __repr__(self):
         """Represent this object as a string."""
@@ -104,152 +239,173 @@ class URLSetting:
 
     def parse_value(self, value: Optional[str]):
         """Parse the URL string and load its components."""
-        parsed_url = None
-        if value is self or not value:
+        if value and value is not self:
+            self._url_str = value
+            self.parsed_urls, self.parsed_query = parse_url(value, self.split_char)
+            self._loaded = True
+        else:
             self._url_str = None
             self.parsed_urls = None
             self.parsed_query = None
-        elif self.split_char != "":
-            self._url_str = value
-            parsed_url = urllib.parse.urlparse(value)
-            self.parsed_urls = [
-                parsed_url._replace(netloc=x)
-                for x in parsed_url.netloc.split(self.split_char)
-            ]
+            self._loaded = False
+        self.__set_components()
+
+    def __set_components(self):
+        """Compute once all URL components, so accessors do not parse the netloc again."""
+        parsed_urls = self.parsed_urls
+        if not parsed_urls:
+            self._scheme = self._netloc = self._hostname = None
+            self._default_port = self._path = self._params = self._query = None
+            self._username = self._password = None
+            self._use_ssl = self._use_tls = False
+            self._ssl_mode = None
+            return
+        first = parsed_urls[0]
+        scheme, default_port, use_ssl, use_tls = self.lookup_scheme(first.scheme)
+        join = self.split_char.join
+        self._scheme = scheme
+        # same params semantics as urllib.parse.urlparse
+        path, params = first.path, ""
+        if first.scheme in urllib.parse.uses_params and ";" in path:
+            slash = path.rfind("/")
+            semicolon = path.find(";", slash if slash >= 0 else 0)
+            if semicolon >= 0:
+                path, params = path[:semicolon], path[semicolon + 1 :]
+        self._path = path
+        self._params = params
+        self._query = first.query
+        self._username = first.username
+        self._password = first.password
+        self._ssl_mode = self.compute_ssl_mode(self.parsed_query, use_ssl)
+        self._use_ssl = use_ssl or self._ssl_mode in SECURE_SSL_MODES
+        self._use_tls = use_tls
+        # ports are only parsed on demand, so an invalid port does not break other components
+        self._default_port = default_port
+        if len(parsed_urls) == 1:
+            self._netloc = first.netloc
+            self._hostname = first.hostname
         else:
-            self._url_str = value
-            parsed_url = urllib.parse.urlparse(value)
-            self.parsed_urls = [parsed_url]
-        if parsed_url:
-            self.parsed_query = urllib.parse.parse_qs(parsed_url.query)
-        self._loaded = bool(parsed_url)
+            self._netloc = join(x.netloc for x in parsed_urls)
+            self._hostname = join(x.hostname or "" for x in parsed_urls)
 
     def load(self, merger):
         """Get the URL string for the merger, parse it and load it to extract its components."""
         if self._loaded or not self.setting_name:
             return
-        for required in self.required:
-            merger.get_setting_value(required)
+        if self.required:
+            for required in self.required:
+                merger.get_setting_value(required)
         value = merger.get_setting_value(self.setting_name)
         self.parse_value(value)
         self._loaded = True
 
     def hostname(self, default="localhost"):
         """Return a DynamicSetting that represents the hostname."""
-        return Attribute(self, self.hostname_, default=default)
+        return Attribute(self, type(self).hostname_, default=default)
 
     def hostname_(self) -> Optional[str]:
         """Return the hostname."""
-        if self.parsed_urls is None:
-            return None
-        return self.split_char.join(x.hostname for x in self.parsed_urls)
+        return self._hostname
 
     def netloc(self, default="localhost"):
         """Return a DynamicSetting that represents the netloc."""
-        return Attribute(self, self.netloc_, default=default)
+        return Attribute(self, type(self).netloc_, default=default)
 
     def netloc_(self) -> Optional[str]:
         """Return the netloc."""
-        if self.parsed_urls is None:
-            return None
-        return self.split_char.join(x.netloc for x in self.parsed_urls)
+        return self._netloc
 
     def params(self, default=""):
         """Return a DynamicSetting that represents the params."""
-        return Attribute(self, self.params_, default=default)
+        return Attribute(self, type(self).params_, default=default)
 
     def params_(self) -> Optional[str]:
         """Return the params part of the URL."""
-        return self.get_attribute_single("params")
+        return self._params
 
     def get_attribute_single(self, attr_name) -> Optional[str]:
-        """Return the params part of the URL."""
+        """Return an attribute of the first URL."""
         if self.parsed_urls is None:
             return None
         return getattr(self.parsed_urls[0], attr_name)
 
     def get_attribute_multiple(self, attr_name) -> Optional[str]:
-        """Return the params part of the URL."""
-        if self.parsed_urls is None:
+        """Return an attribute of all URLs, joined by the split character."""
+        parsed_urls = self.parsed_urls
+        if parsed_urls is None:
             return None
-        return self.split_char.join(getattr(x, attr_name) for x in self.parsed_urls)
+        elif len(parsed_urls) == 1:
+            return getattr(parsed_urls[0], attr_name)
+        return self.split_char.join(getattr(x, attr_name) for x in parsed_urls)
 
     def password(self, default=None):
         """Return a DynamicSetting that represents the password."""
-        return Attribute(self, self.password_, default=default)
+        return Attribute(self, type(self).password_, default=default)
 
     def password_(self) -> Optional[str]:
         """Return the user password."""
-        return self.get_attribute_single("password")
+        return self._password
 
     def path(self, default=""):
         """Return a DynamicSetting that represents the path of the URL."""
-        return Attribute(self, self.path_, default=default)
+        return Attribute(self, type(self).path_, default=default)
 
     def path_(self) -> Optional[str]:
         """Return the path of the URL."""
-        return self.get_attribute_single("path")
+        return self._path
 
     def port(self, default=None):
         """Return a DynamicSetting that represents the port of the URL."""
-        return Attribute(self, self.port_, default=default)
+        return Attribute(self, type(self).port_, default=default)
 
     def port_(self) -> Optional[str]:
         """Return the port of the URL."""
-        if self.parsed_urls is None:
+        parsed_urls = self.parsed_urls
+        if not parsed_urls:
             return None
-        ports = []
-        for parsed_url in self.parsed_urls:
-            if parsed_url.port:
-                ports.append(str(parsed_url.port))
-            else:
-                s = parsed_url.scheme.lower()
-                s = self.SCHEME_ALIASES.get(s, s)
-                ports.append(str(self.SCHEMES[s][0]))
-        return self.split_char.join(ports)
+        default_port = self._default_port
+        if len(parsed_urls) == 1:
+            return str(parsed_urls[0].port or default_port)
+        return self.split_char.join(str(x.port or default_port) for x in parsed_urls)
 
     def query(self, default=""):
         """Return a DynamicSetting that represents the query string from the URL."""
-        return Attribute(self, self.query_, default=default)
+        return Attribute(self, type(self).query_, default=default)
 
     def query_(self) -> Optional[str]:
         """Return the query string from the URL."""
-        return self.get_attribute_single("query")
+        return self._query
 
     def scheme(self, default=None):
         """Return a DynamicSetting that represents the URL scheme."""
-        return Attribute(self, self.scheme_, default=default)
+        return Attribute(self, type(self).scheme_, default=default)
 
     def scheme_(self) -> Optional[str]:
         """Return the URL scheme."""
-        if self.parsed_urls is None:
-            return None
-        scheme = self.parsed_urls[0].scheme.lower()
-        scheme = self.SCHEME_ALIASES.get(scheme, scheme)
-        return scheme
+        return self._scheme
 
     def username(self, default=None):
         """Return a DynamicSetting that represents the username."""
-        return Attribute(self, self.username_, default=default)
+        return Attribute(self, type(self).username_, default=default)
 
     def username_(self):
         """Return the username, if defined in the URL string."""
-        return self.get_attribute_single("username")
+        return self._username
 
     def database(self, default=None):
         """Return a DynamicSetting that represents the database name."""
-        return Attribute(self, self.database_, default=default)
+        return Attribute(self, type(self).database_, default=default)
 
     def database_(self):
         """Return the database name."""
-        v = self.get_attribute_single("path")
-        if not v or not (matcher := re.match(r"/([^/]+)", v)):
+        v = self._path
+        if not v or v[0] != "/":
             return None
-        return matcher.group(1)
+        return v[1:].partition("/")[0] or None
 
     def port_int(self, default=None):
         """Return an integer value for the port (the default one if not specified)."""
-        return Attribute(self, self.port_int_, default=default)
+        return Attribute(self, type(self).port_int_, default=default)
 
     def port_int_(self) -> Optional[int]:
         """Return the port number for the port (the default one if not specified)."""
@@ -257,64 +413,54 @@ class URLSetting:
             return None
         elif len(self.parsed_urls) > 1:
             raise ImproperlyConfigured("Multiple URLs, cannot return a single port.")
-        parsed_url = self.parsed_urls[0]
-        if parsed_url.port:
-            return parsed_url.port
-        s = parsed_url.scheme.lower()
-        s = self.SCHEME_ALIASES.get(s, s)
-        return self.SCHEMES[s][0]
+        return self.parsed_urls[0].port or self._default_port
 
     def use_tls(self, default=False):
         """Return a dynamic setting for the TLS usage."""
-        return Attribute(self, self.use_tls_, default=default)
+        return Attribute(self, type(self).use_tls_, default=default)
 
-    def use_tls_(self, index=2):
+    def use_tls_(self):
         """Return True is TLS is used."""
-        if not self.parsed_urls:
-            return False
-        s = self.scheme_()
-        response = self.SCHEMES[s][index]
-        return response
+        return self._use_tls
 
     def use_ssl(self, default=False):
         """Return a dynamic setting for the SSL usage."""
-        return Attribute(self, self.use_ssl_, default=default)
+        return Attribute(self, type(self).use_ssl_, default=default)
 
     def use_ssl_(self):
         """Return True if SSL is used."""
-        return self.use_tls_(index=1) or self.ssl_mode_() in {
-            "require",
-            "verify-ca",
-            "verify-full",
-        }
+        return self._use_ssl
 
     def engine(self, default=None):
         """Return a dynamic setting for the database engine."""
-        return Attribute(self, self.engine_, default=default)
+        return Attribute(self, type(self).engine_, default=default)
 
     def engine_(self):
         """Return the engine name from the URL scheme."""
         if not self.parsed_urls:
             return None
-        scheme = self.parsed_urls[0].scheme.lower()
-        return self.normalize_engine(scheme)
+        return self.normalize_engine(self._scheme)
 
     @classmethod
     def normalize_engine(cls, scheme: str):
         """Return a normalized Django engine name from a URL scheme string."""
+        try:
+            return cls._engine_resolved[scheme]
+        except KeyError:
+            pass
+        engine = cls.resolve_engine(scheme)
+        cls._engine_resolved[scheme] = engine
+        return engine
+
+    @classmethod
+    def resolve_engine(cls, scheme: str):
+        """Return the Django engine name from a URL scheme, checking that its requirements are installed."""
         scheme = cls.SCHEME_ALIASES.get(scheme, scheme)
         engine = cls.ENGINES.get(scheme, scheme)
-        requirements = cls.REQUIREMENTS.get(engine, [])
-        found = False
-        for req in requirements:
-            try:
-                version(req)
-                found = True
-            except PackageNotFoundError:
-                pass
+        requirements = cls.REQUIREMENTS.get(engine, ())
+        installed = installed_distributions()
+        found = any(normalize_distribution_name(x) in installed for x in requirements)
         if not found and requirements:
-            from df_config.checks import missing_package, settings_check_results
-
             settings_check_results.append(
                 missing_package("/".join(requirements), f" to use {engine}.")
             )
@@ -324,70 +470,63 @@ class URLSetting:
         """Return the client certificate file from the URL query string."""
         if not self.parsed_urls:
             return None
-        return self.parsed_query.get("ssl_certfile", [""])[0] or None
+        return self.parsed_query.get("ssl_certfile", ("",))[0] or None
 
     def client_cert(self, default=None) -> Attribute:
         """Return a dynamic setting for the client certificate."""
-        return Attribute(self, self.client_cert_, default=default)
+        return Attribute(self, type(self).client_cert_, default=default)
 
     def client_key_(self) -> Optional[str]:
         """Return the client key file from the URL query string."""
         if not self.parsed_urls:
             return None
         # ssl_check_hostname=false&ssl_cert_reqs=required&ssl_certfile=./localhost.crt&ssl_keyfile=./localhost.key&ssl_ca_certs=./CA.crt
-        return self.parsed_query.get("ssl_keyfile", [""])[0] or None
+        return self.parsed_query.get("ssl_keyfile", ("",))[0] or None
 
     def client_key(self, default=None) -> Attribute:
         """Return a dynamic setting for the client key."""
-        return Attribute(self, self.client_key_, default=default)
+        return Attribute(self, type(self).client_key_, default=default)
 
     def ca_cert_(self) -> Optional[str]:
         """Return the CA certificate file from the URL query string."""
         if not self.parsed_urls:
             return None
-        return self.parsed_query.get("ssl_ca_certs", [""])[0] or None
+        return self.parsed_query.get("ssl_ca_certs", ("",))[0] or None
 
     def ca_cert(self, default=None) -> Attribute:
         """Return a dynamic setting for the CA certificate."""
-        return Attribute(self, self.ca_cert_, default=default)
+        return Attribute(self, type(self).ca_cert_, default=default)
 
     def ca_crl_(self) -> Optional[str]:
         """Return the CRL file from the URL query string."""
         if not self.parsed_urls:
             return None
-        return self.parsed_query.get("ssl_crlfile", [""])[0] or None
+        return self.parsed_query.get("ssl_crlfile", ("",))[0] or None
 
     def ca_crl(self, default=None) -> Attribute:
         """Return a dynamic setting for the CRL file."""
-        return Attribute(self, self.ca_crl_, default=default)
+        return Attribute(self, type(self).ca_crl_, default=default)
 
     def ssl_mode_(self) -> Optional[str]:
         """Return the SSL mode from the URL query string (mysql and postgres)."""
-        if not self.parsed_urls:
-            return None
-        ssl_mode = self.parsed_query.get("ssl_mode", ["allow"])[0]
-        if ssl_mode in {
-            "disable",
-            "allow",
-            "prefer",
-            "require",
-            "verify-ca",
-            "verify-full",
-        }:
+        return self._ssl_mode
+
+    @staticmethod
+    def compute_ssl_mode(query: Mapping[str, Tuple[str, ...]], scheme_ssl: bool) -> str:
+        """Compute the SSL mode from the parsed URL query string and the SSL flag of the scheme."""
+        get = query.get
+        ssl_mode = get("ssl_mode", ("allow",))[0]
+        if ssl_mode in SSL_MODES:
             return ssl_mode
-        check_hostname = (
-            self.parsed_query.get("ssl_check_hostname", ["true"])[0] != "false"
-        )
-        check_ca = self.parsed_query.get("ssl_cert_reqs", ["required"])[0] != "none"
-        use_ssl = (
-            self.use_tls_(index=1) or self.parsed_query.get("ssl", [""])[0] == "true"
-        )
-        avoid_ssl = self.parsed_query.get("ssl", [""])[0] == "false"
+        check_hostname = get("ssl_check_hostname", ("true",))[0] != "false"
+        check_ca = get("ssl_cert_reqs", ("required",))[0] != "none"
+        ssl = get("ssl", ("",))[0]
+        avoid_ssl = ssl == "false"
         if not avoid_ssl and check_hostname:
             return "verify-full"
         elif not avoid_ssl and check_ca:
             return "verify-ca"
-        elif use_ssl:
+        elif scheme_ssl or ssl == "true":
             return "require"
         elif avoid_ssl:
             return "disable"
@@ -395,37 +534,55 @@ class URLSetting:
 
     def ssl_mode(self, default=None) -> Attribute:
         """Return a dynamic setting for the SSL mode."""
-        return Attribute(self, self.ssl_mode_, default=default)
+        return Attribute(self, type(self).ssl_mode_, default=default)
+
+
+URLSetting._scheme_table = URLSetting.build_scheme_table()
 
 
 class DatabaseURL(URLSetting):
     """Guess the database engines from a URL string."""
 
-    ENGINES = {
-        "mysql": "django.db.backends.mysql",
-        "mariadb": "django.db.backends.mysql",
-        "oracle": "django.db.backends.oracle",
-        "postgres": "django.db.backends.postgresql",
-        "sqlite3": "django.db.backends.sqlite3",
-    }
-    SCHEME_ALIASES = {
-        "psql": "postgres",
-        "postgresql": "postgres",
-        "sqlite": "sqlite3",
-    }
-    REQUIREMENTS = {
-        "django.db.backends.postgresql": ["psycopg2-binary", "psycopg2", "psycopg"],
-        "django.db.backends.oracle": ["cx_Oracle"],
-        "django.db.backends.mysql": ["mysqlclient", "pymysql"],
-    }
+    __slots__ = ()
+
+    ENGINES = MappingProxyType(
+        {
+            "mysql": "django.db.backends.mysql",
+            "mariadb": "django.db.backends.mysql",
+            "oracle": "django.db.backends.oracle",
+            "postgres": "django.db.backends.postgresql",
+            "sqlite3": "django.db.backends.sqlite3",
+        }
+    )
+    SCHEME_ALIASES = MappingProxyType(
+        {
+            "psql": "postgres",
+            "postgresql": "postgres",
+            "sqlite": "sqlite3",
+        }
+    )
+    REQUIREMENTS = MappingProxyType(
+        {
+            "django.db.backends.postgresql": ("psycopg2-binary", "psycopg2", "psycopg"),
+            "django.db.backends.oracle": ("cx_Oracle",),
+            "django.db.backends.mysql": ("mysqlclient", "pymysql"),
+        }
+    )
 
 
 class RedisURL(URLSetting):
     """Specialized class for Redis URLs, since databases are identified by an integer."""
 
+    __slots__ = ()
+
     def database_(self) -> Optional[int]:
         """Extract a valid database number for Redis connections."""
-        v = self.get_attribute_single("path")
-        if not v or not (matcher := re.match(r"/(0|[1-9]\d*)$", v)):
+        v = self._path
+        if not v or v[0] != "/":
+            return None
+        tail = v[1:]
+        if tail == "0":
+            return 0
+        elif not tail or tail[0] not in "123456789" or not tail.isdecimal():
             return None
-        return int(matcher.group(1))
+        return int(tail)
@@ -19,20 +19,27 @@ A value provider can be a configuration file, a Python module, the environment,
 Each value provider can be used to get or set the value of a configuration field. Some of them
 can also be used to define extra configuration values, like the Python module.
 """
-import hashlib
-import importlib.util
 import os
-import shlex
-from collections import OrderedDict
-from configparser import ConfigParser
+from functools import lru_cache
 from importlib import import_module
 from io import StringIO
-from typing import Any, Iterable, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from df_config.config.fields import ConfigField
 from df_config.config.fields_providers import import_attribute
 
 
+@lru_cache(maxsize=4096)
+def split_field_name(name: str) -> Tuple[str, str]:
+    """Split the name of a config field into its .ini section and option.
+
+    >>> split_field_name("global.server_url")
+    ('global', 'server_url')
+    """
+    section, sep, option = name.partition(".")
+    return section, option
+
+
 class ConfigProvider:
     """Base class of config provider."""
 
@@ -53,6 +60,19 @@ class ConfigProvider:
         """
         raise NotImplementedError
 
+    def get_values(
+        self, config_fields: Iterable[ConfigField]
+    ) -> Dict[ConfigField, Any]:
+        """Return the internal values of all config fields that are present in the provider.
+
+        :return: a dict {config_field: value}, only containing the fields that are defined by this provider.
+        """
+        return {
+            config_field: self.get_value(config_field)
+            for config_field in config_fields
+            if self.has_value(config_field)
+        }
+
     def get_extra_settings(self) -> Iterable[Tuple[str, Any]]:
         """Return all settings internally defined.
 
@@ -77,9 +97,23 @@ class EnvironmentConfigProvider(ConfigProvider):
     def __init__(self, prefix, mapping: str = None):
         """Read values from the environment."""
         self.prefix = prefix
-        self.exports = ""
-        self.exported_lines = []
+        self.exported_lines: List[str] = []
         self.exported_values = set()
+        self._environ: Optional[Dict[str, str]] = None
+        self._parsed: Dict[ConfigField, Any] = {}
+        self._keys: Dict[ConfigField, Optional[str]] = {}
+
+    @property
+    def environ(self) -> Dict[str, str]:
+        """Return a copy of the environment, taken on first use."""
+        if self._environ is None:
+            self._environ = dict(os.environ)
+        return self._environ
+
+    def refresh(self):
+        """Take a new copy of the environment (useful for long-lived processes)."""
+        self._environ = None
+        self._parsed.clear()
 
     def __str__(self):
         """Display the number of exported values."""
@@ -93,14 +127,19 @@ class EnvironmentConfigProvider(ConfigProvider):
         key = self.get_key(config_field)
         if key is None:
             return False
-        return key in os.environ
+        return key in self.environ
 
     def get_key(self, config_field):
         """Get the key used in the environment for a given config field."""
+        try:
+            return self._keys[config_field]
+        except KeyError:
+            pass
         if config_field.environ_name is config_field.AUTO:
             key = f"{self.prefix}{config_field.setting_name}"
         else:
             key = config_field.environ_name
+        self._keys[config_field] = key
         return key
 
     def set_value(self, config_field, include_doc=False):
@@ -109,22 +148,28 @@ class EnvironmentConfigProvider(ConfigProvider):
         if key is None:
             return
         value = config_field.to_str(config_field.value)
-        key = shlex.quote(key)
+        import shlex
+
+        if not (key.isascii() and key.isidentifier()):
+            key = shlex.quote(key)
         value = shlex.quote(value)
         doc = ""
         if include_doc and config_field.__doc__:
-            for doc_line in config_field.__doc__.splitlines():
-                doc += f"\n# {doc_line}"
-        self.exports += f"{key}={value}{doc}\n"
+            doc = "".join(f"\n# {x}" for x in config_field.__doc__.splitlines())
         self.exported_lines.append(f"{key}={value}{doc}")
 
     def get_value(self, config_field):
         """Get the value of a config field from the environment, or the current value if not defined."""
         key = self.get_key(config_field)
-        if key in os.environ:
-            self.exported_values.add(key)
-            return config_field.from_str(os.environ[key])
-        return config_field.value
+        environ = self.environ
+        if key not in environ:
+            return config_field.value
+        self.exported_values.add(key)
+        try:
+            return self._parsed[config_field]
+        except KeyError:
+            value = self._parsed[config_field] = config_field.from_str(environ[key])
+        return value
 
     def get_extra_settings(self):
         """No extra setting can be defined in the environment."""
@@ -136,10 +181,8 @@ class EnvironmentConfigProvider(ConfigProvider):
 
     def to_str(self):
         """Display the exported values, sorting lines by keys."""
-        return (
-            "\n".join(sorted(self.exported_lines, key=lambda x: x.partition("=")))
-            + "\n"
-        )
+        lines = sorted(self.exported_lines, key=lambda x: x.partition("="))
+        return "\n".join(lines) + "\n"
 
 
 class IniConfigProvider(ConfigProvider):
@@ -149,22 +192,52 @@ class IniConfigProvider(ConfigProvider):
 
     def __init__(self, config_file=None):
         """Read a config file using the .ini syntax."""
+        from configparser import ConfigParser
+
         self.parser = ConfigParser()
         self.config_file = config_file
         if config_file:
             self.parser.read([config_file])
+        self._values: Optional[Dict[Tuple[str, str], Any]] = None
+        # {config_field: (str_value, converted value)}
+        self._parsed: Dict[ConfigField, Tuple[str, Any]] = {}
 
     def __str__(self):
         """Display the name of the config file."""
         return self.config_file
 
+    def __get_values(self) -> Dict[Tuple[str, str], Any]:
+        """Return all (interpolated) options of the parser, as a {(section, option): value} dict.
+
+        Options that cannot be interpolated are stored as their exception, raised when they are read.
+        """
+        if self._values is not None:
+            return self._values
+        from configparser import InterpolationError
+
+        parser = self.parser
+        values = {}
+        sections = [parser.default_section] + parser.sections()
+        for section in sections:
+            options = (
+                parser.defaults()
+                if section == parser.default_section
+                else parser[section]
+            )
+            for option in options:
+                try:
+                    values[(section, option)] = parser.get(section, option)
+                except InterpolationError as e:
+                    values[(section, option)] = e
+        self._values = values
+        return values
+
     @staticmethod
     def __get_info(config_field: ConfigField):
         """Get the section and option of a config field."""
         if config_field.name is None:
             return None, None
-        section, sep, option = config_field.name.partition(".")
-        return section, option
+        return split_field_name(config_field.name)
 
     def set_value(self, config_field: ConfigField, include_doc: bool = False):
         """Update the internal config file."""
@@ -178,23 +251,33 @@ class IniConfigProvider(ConfigProvider):
             for line in config_field.__doc__.splitlines():
                 to_str += " \n# %s" % line
         self.parser.set(section, option, to_str)
+        self._values = None
 
     def get_value(self, config_field: ConfigField):
         """Get option from the config file."""
         section, option = self.__get_info(config_field)
         if section is None:
             return None
-        if self.parser.has_option(section=section, option=option):
-            str_value = self.parser.get(section=section, option=option)
-            return config_field.from_str(str_value)
-        return config_field.value
+        key = (section, self.parser.optionxform(option))
+        try:
+            str_value = self.__get_values()[key]
+        except KeyError:
+            return config_field.value
+        if isinstance(str_value, Exception):
+            raise str_value
+        cached = self._parsed.get(config_field)
+        if cached is not None and cached[0] == str_value:
+            return cached[1]
+        value = config_field.from_str(str_value)
+        self._parsed[config_field] = (str_value, value)
+        return value
 
     def has_value(self, config_field: ConfigField):
         """Return `True` if the option is defined in the config file."""
         section, option = self.__get_info(config_field)
         if section is None:
             return False
-        return self.parser.has_option(section=section, option=option)
+        return (section, self.parser.optionxform(option)) in self.__get_values()
 
     def get_extra_settings(self):
         """No extra setting can be defined in a config file."""
@@ -205,10 +288,24 @@ class IniConfigProvider(ConfigProvider):
         return os.path.isfile(self.config_file)
 
     def to_str(self):
-        """Display the config file."""
-        fd = StringIO()
-        self.parser.write(fd)
-        return fd.getvalue()
+        """Display the config file, in the same format as :meth:`ConfigParser.write`."""
+        parser = self.parser
+        if parser.defaults():
+            # options of the DEFAULT section would be merged into every section below
+            fd = StringIO()
+            parser.write(fd)
+            return fd.getvalue()
+        lines = []
+        for section in parser.sections():
+            lines.append(f"[{section}]")
+            for key, value in parser.items(section, raw=True):
+                if value is None:
+                    lines.append(key)
+                else:
+                    value = str(value).replace("\n", "\n\t")
+                    lines.append(f"{key} = {value}")
+            lines.append("")
+        return "\n".join(lines) + "\n" if lines else ""
 
 
 class PythonModuleProvider(ConfigProvider):
@@ -220,7 +317,8 @@ class PythonModuleProvider(ConfigProvider):
         """Load a Python module from its dotted name."""
         self.module_name = module_name
         self.module = None
-        self.values = OrderedDict()
+        self.values: Dict[str, Any] = {}
+        self._module_dict: Dict[str, Any] = {}
         if module_name is not None:
             try:
                 self.module = import_module(module_name, package=None)
@@ -228,6 +326,8 @@ class PythonModuleProvider(ConfigProvider):
                 pass
             except ImportError:
                 pass
+            else:
+                self._module_dict = self.module.__dict__
 
     def __str__(self):
         """Display the name of the Python module."""
@@ -239,23 +339,17 @@ class PythonModuleProvider(ConfigProvider):
 
     def get_value(self, config_field):
         """Get the value of a variable defined in the Python module."""
-        if self.module is None or not hasattr(self.module, config_field.setting_name):
-            return config_field.value
-        return getattr(self.module, config_field.setting_name)
+        return self._module_dict.get(config_field.setting_name, config_field.value)
 
     def has_value(self, config_field):
         """Return `True` if the corresponding variable is defined in the module."""
-        return self.module is not None and hasattr(
-            self.module, config_field.setting_name
-        )
+        return config_field.setting_name in self._module_dict
 
     def get_extra_settings(self):
         """Return all values that look like a Django setting (i.e. uppercase variables)."""
-        if self.module is not None:
-            for key, value in sorted(self.module.__dict__.items()):
-                if key.upper() != key or key == "_":
-                    continue
-                yield key, value
+        module_dict = self._module_dict
+        for key in sorted(x for x in module_dict if x.isupper()):
+            yield key, module_dict[key]
 
     def is_valid(self):
         """Return `True` if the module can be imported."""
@@ -263,10 +357,7 @@ class PythonModuleProvider(ConfigProvider):
 
     def to_str(self):
         """Display values as if set in a Python module."""
-        fd = StringIO()
-        for k, v in sorted(self.values.items()):
-            fd.write("%s = %r\n" % (k, v))
-        return fd.getvalue()
+        return "".join(f"{k} = {v!r}\n" for k, v in sorted(self.values.items()))
 
 
 class PythonFileProvider(PythonModuleProvider):
@@ -280,12 +371,18 @@ class PythonFileProvider(PythonModuleProvider):
         super().__init__()
         if not os.path.isfile(module_filename):
             return
-        md5 = hashlib.md5(module_filename.encode("utf-8")).hexdigest()  # nosec  # nosec
-        module_name = "df_config.__private" + md5
+        import hashlib
+        import importlib.util
+
+        digest = hashlib.blake2b(
+            module_filename.encode("utf-8"), digest_size=16
+        ).hexdigest()
+        module_name = "df_config.__private" + digest
         spec = importlib.util.spec_from_file_location(module_name, module_filename)
         module_ = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(module_)
         self.module = module_
+        self._module_dict = module_.__dict__
 
     def __str__(self):
         """Display the filename of the Python file."""
@@ -320,6 +417,15 @@ class DictProvider(ConfigProvider):
         """Get a value from the internal dict if present."""
         return self.values.get(config_field.setting_name, config_field.value)
 
+    def get_values(self, config_fields):
+        """Get all values that are present in the internal dict."""
+        values = self.values
+        return {
+            config_field: values[config_field.setting_name]
+            for config_field in config_fields
+            if config_field.setting_name in values
+        }
+
     def has_value(self, config_field):
         """Check if the value is present in the internal dict."""
         return config_field.setting_name in self.values
@@ -334,4 +440,5 @@ class DictProvider(ConfigProvider):
 
     def to_str(self):
         """Display the internal dict."""
-        return "%r" % dict(self.values)
+        values = self.values
+        return repr(values if type(values) is dict else dict(values))
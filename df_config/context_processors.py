@@ -13,17 +13,37 @@
 #  or https://cecill.info/licences/Licence_CeCILL-B_V1-fr.txt (French)         #
 #                                                                              #
 # ##############################################################################
+from types import MappingProxyType
+
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+_config = None
 
 
 def config(request):
     """
     Adds a few values to the request context.
+
+    Settings do not change once loaded, so these values are computed only once.
     """
-    return {
-        "ADMIN_EMAIL": settings.ADMIN_EMAIL,
-        "DF_PROJECT_NAME": settings.DF_PROJECT_NAME,
-        "DF_PROJECT_VERSION": settings.DF_PROJECT_VERSION,
-        "SERVER_URL": settings.SERVER_BASE_URL,
-        "SERVER_NAME": settings.SERVER_NAME,
-    }
+    global _config
+    if _config is None:
+        _config = MappingProxyType(
+            {
+                "ADMIN_EMAIL": settings.ADMIN_EMAIL,
+                "DF_PROJECT_NAME": settings.DF_PROJECT_NAME,
+                "DF_PROJECT_VERSION": settings.DF_PROJECT_VERSION,
+                "SERVER_URL": settings.SERVER_BASE_URL,
+                "SERVER_NAME": settings.SERVER_NAME,
+            }
+        )
+    return _config
+
+
+@receiver(setting_changed)
+def reset_config(**kwargs):
+    """Compute the context values again when settings are overridden (e.g., in tests)."""
+    global _config
+    _config = None
@@ -1,21 +1,36 @@
+from functools import lru_cache
 from queue import Queue
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from logging_loki import LokiQueueHandler, emitter
 
 emitter.LokiEmitter.level_tag = "level"
+_missing = object()
+# (Django setting, Loki tag) pairs added to every record when the setting is defined
+LOKI_TAG_SETTINGS: Tuple[Tuple[str, str], ...] = (
+    ("SERVER_NAME", "application"),
+    ("CURRENT_COMMAND_NAME", "command"),
+    ("HOSTNAME", "hostname"),
+)
+
+
+@lru_cache(maxsize=1)
+def get_loki_tags() -> Dict[str, Any]:
+    """Return the tags added to all Loki records, read once from the Django settings."""
+    from django.conf import settings
+
+    tags = {"log_source": "django"}
+    for setting_name, tag in LOKI_TAG_SETTINGS:
+        value = getattr(settings, setting_name, _missing)
+        if value is not _missing:
+            tags[tag] = value
+    return tags
 
 
 class LokiHandler(LokiQueueHandler):
     def __init__(
         self, url: Optional[str] = None, auth: Optional[Tuple[str, str]] = None
     ):
-        from django.conf import settings
-
-        tags = {
-            "application": settings.SERVER_NAME,
-            "command": settings.CURRENT_COMMAND_NAME,
-            "hostname": settings.HOSTNAME,
-            "log_source": "django",
-        }
-        super().__init__(Queue(-1), url=url, tags=tags, auth=auth, version="1")
+        super().__init__(
+            Queue(-1), url=url, tags=get_loki_tags(), auth=auth, version="1"
+        )
@@ -15,27 +15,54 @@
 # ##############################################################################
 """Check installed modules and settings to provide lists of middlewares/installed apps."""
 import os
-from collections import OrderedDict
-from configparser import RawConfigParser
-from importlib.metadata import PackageNotFoundError, version
+from functools import lru_cache
+from typing import FrozenSet, Optional
 
 from django.core.checks import Error
 
 from df_config.checks import missing_package, settings_check_results
 from df_config.config.dynamic_settings import ExpandIterable
-from df_config.guesses.social_providers import SOCIAL_PROVIDER_APPS
 from df_config.utils import is_package_present
 
 
+@lru_cache(maxsize=None)
+def distribution_version(name: str) -> Optional[str]:
+    """Return the version of an installed distribution, or `None` if it is not installed."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def is_csp_app_required() -> bool:
+    """Return `True` if the installed django-csp must be added to `INSTALLED_APPS` (django-csp >= 4)."""
+    csp_version = distribution_version("django-csp")
+    return csp_version is not None and csp_version[0] > "3"
+
+
+@lru_cache(maxsize=1)
+def get_social_provider_apps() -> FrozenSet[str]:
+    """Return all social account provider apps of django-allauth, only looked up on first use."""
+    from df_config.guesses.social_providers import SOCIAL_PROVIDER_APPS
+
+    return frozenset(SOCIAL_PROVIDER_APPS)
+
+
 def allauth_provider_apps(settings_dict):
     """Provide configured authentications for django_allauth."""
-    parser = RawConfigParser()
     config = settings_dict["ALLAUTH_APPLICATIONS_CONFIG"]
     if not os.path.isfile(config):
         return []
+    from configparser import RawConfigParser
+
+    parser = RawConfigParser()
     # noinspection PyBroadException
     try:
-        parser.read([config])
+        with open(config, encoding="utf-8") as fd:
+            parser.read_string(fd.read(), source=config)
     except Exception:  # nosec  # nosec
         settings_check_results.append(
             Error(
@@ -61,10 +88,8 @@ class InstalledApps:
     Specifically handle apps required by django-allauth (one by allowed method).
     """
 
-    default_apps = [
-        ExpandIterable("DF_INSTALLED_APPS"),
-    ]
-    base_django_apps = [
+    default_apps = (ExpandIterable("DF_INSTALLED_APPS"),)
+    base_django_apps = (
         "df_config",
         "django.contrib.auth",
         "django.contrib.contenttypes",
@@ -74,19 +99,22 @@ class InstalledApps:
         "django.contrib.sites",
         "django.contrib.staticfiles",
         "{DF_ADMIN_APP_CONFIG}",
-    ]
-    common_third_parties = OrderedDict(
-        [
-            ("USE_WEBSOCKETS", ["df_websockets", "channels"]),
-            ("USE_DEBUG_TOOLBAR", ["debug_toolbar.apps.DebugToolbarConfig"]),
-            ("USE_PIPELINE", ["pipeline"]),
-            ("USE_PAM_AUTHENTICATION", ["django_pam"]),
-            ("USE_CORS_HEADER", ["corsheaders"]),
-            ("USE_DAPHNE", ["daphne"]),
-            ("USE_DJANGO_PROBES", ["django_probes"]),
-            ("USE_CSP", "csp"),
-            ("USE_PROMETHEUS", "django_prometheus"),
-        ]
+    )
+    # (setting name, apps to add if this setting is True)
+    common_third_parties = (
+        ("USE_WEBSOCKETS", ["df_websockets", "channels"]),
+        ("USE_DEBUG_TOOLBAR", ["debug_toolbar.apps.DebugToolbarConfig"]),
+        ("USE_PIPELINE", ["pipeline"]),
+        ("USE_PAM_AUTHENTICATION", ["django_pam"]),
+        ("USE_CORS_HEADER", ["corsheaders"]),
+        ("USE_DAPHNE", ["daphne"]),
+        ("USE_DJANGO_PROBES", ["django_probes"]),
+        ("USE_CSP", ["csp"]),
+        ("USE_PROMETHEUS", ["django_prometheus"]),
+    )
+    # (setting name, package name, apps)
+    third_party_packages = tuple(
+        (k, v[0].partition(".")[0], v) for k, v in common_third_parties
     )
     required_settings = [
         "ALLAUTH_PROVIDER_APPS",
@@ -94,36 +122,31 @@ class InstalledApps:
         "DF_INSTALLED_APPS",
         "SESSION_ENGINE",
         "USE_ALL_AUTH",
-    ] + list(common_third_parties)
-    social_apps = SOCIAL_PROVIDER_APPS
+    ] + [k for k, v in common_third_parties]
+    # allowed social account apps (None: all apps provided by django-allauth)
+    social_apps = None
 
     def __call__(self, settings_dict):
         """Check available packages and return the list of installed apps."""
-        apps = self.default_apps
+        apps = list(self.default_apps)
         if settings_dict["SESSION_ENGINE"] == "django.contrib.sessions.backends.db":
-            apps += ["django.contrib.sessions"]
-        apps += self.process_django_allauth(settings_dict)
-        apps += self.process_third_parties(settings_dict)
-        apps += self.base_django_apps
+            apps.append("django.contrib.sessions")
+        apps.extend(self.process_django_allauth(settings_dict))
+        apps.extend(self.process_third_parties(settings_dict))
+        apps.extend(self.base_django_apps)
         return apps
 
     def process_third_parties(self, settings_dict):
         """Process third-party applications."""
         result = []
-        for k, v in self.common_third_parties.items():
-            package_name = v[0].partition(".")[0]
+        for k, package_name, v in self.third_party_packages:
             if not settings_dict[k]:
                 continue
             elif not is_package_present(package_name):
                 settings_check_results.append(missing_package(package_name, ""))
                 continue
-            if package_name == "csp":
-                try:
-                    if version("django-csp")[0] <= "3":
-                        # the csp app must be added to INSTALLED_APPS for django-csp >= 4
-                        continue
-                except PackageNotFoundError:
-                    continue
+            if package_name == "csp" and not is_csp_app_required():
+                continue
             result += v
         return result
 
@@ -134,9 +157,7 @@ class InstalledApps:
             and not settings_dict["ALLAUTH_PROVIDER_APPS"]
         ):
             return []
-        try:
-            version("django-allauth")
-        except PackageNotFoundError:
+        if distribution_version("django-allauth") is None:
             settings_check_results.append(
                 missing_package(
                     "django-allauth", " to use OAuth2 or OpenID authentication"
@@ -157,11 +178,12 @@ class InstalledApps:
         if is_package_present("pypng") and is_package_present("qrcode"):
             result += ["allauth.mfa"]
         if settings_dict["ALLAUTH_PROVIDER_APPS"]:
+            social_apps = self.social_apps
+            if social_apps is None:
+                social_apps = get_social_provider_apps()
             result += ["allauth.socialaccount"]
             result += [
-                k
-                for k in settings_dict["ALLAUTH_PROVIDER_APPS"]
-                if k in self.social_apps
+                k for k in settings_dict["ALLAUTH_PROVIDER_APPS"] if k in social_apps
             ]
         return result
 
@@ -177,7 +199,7 @@ class Middlewares:
     """Detect common available middlewares."""
 
     use_cache_middleware = True
-    base_django_middlewares = [
+    base_django_middlewares = (
         "django.contrib.sessions.middleware.SessionMiddleware",
         "django.middleware.common.CommonMiddleware",
         "django.middleware.csrf.CsrfViewMiddleware",
@@ -187,46 +209,51 @@ class Middlewares:
         "django.middleware.clickjacking.XFrameOptionsMiddleware",
         "django.middleware.security.SecurityMiddleware",
         "df_config.apps.middleware.DFConfigMiddleware",
-    ]
-    common_third_parties = OrderedDict(
-        [
-            ("USE_WHITENOISE", "whitenoise.middleware.WhiteNoiseMiddleware"),
-            ("USE_WEBSOCKETS", "df_websockets.middleware.WebsocketMiddleware"),
-            ("USE_CSP", "csp.middleware.CSPMiddleware"),
-            ("USE_CORS_HEADER", "corsheaders.middleware.CorsMiddleware"),
-            ("USE_ALL_AUTH", "allauth.account.middleware.AccountMiddleware"),
-        ]
     )
-    required_settings = ["DF_MIDDLEWARE", "USE_PROMETHEUS", "INSTALLED_APPS"] + list(
-        common_third_parties
+    # (setting name, middleware to add if this setting is True)
+    common_third_parties = (
+        ("USE_WHITENOISE", "whitenoise.middleware.WhiteNoiseMiddleware"),
+        ("USE_WEBSOCKETS", "df_websockets.middleware.WebsocketMiddleware"),
+        ("USE_CSP", "csp.middleware.CSPMiddleware"),
+        ("USE_CORS_HEADER", "corsheaders.middleware.CorsMiddleware"),
+        ("USE_ALL_AUTH", "allauth.account.middleware.AccountMiddleware"),
+    )
+    # (setting name, package name, middleware)
+    third_party_packages = tuple(
+        (k, v.partition(".")[0], v) for k, v in common_third_parties
     )
+    required_settings = [
+        "DF_MIDDLEWARE",
+        "INSTALLED_APPS",
+        "USE_DEBUG_TOOLBAR",
+        "USE_PROMETHEUS",
+    ] + [k for k, v in common_third_parties]
 
     def __call__(self, settings_dict):
         """Return the list of required middlewares."""
-        mw_list = []
-        mw_list += self.base_django_middlewares
+        # the outermost middlewares are added last to front and to mw_list
+        front = []
+        mw_list = list(self.base_django_middlewares)
         mw_list.append(ExpandIterable("DF_MIDDLEWARE"))
-        mw_list += self.process_third_parties(settings_dict)
+        mw_list.extend(self.process_third_parties(settings_dict))
         if "allauth.usersessions" in settings_dict["INSTALLED_APPS"]:
             mw_list.append("allauth.usersessions.middleware.UserSessionsMiddleware")
         if settings_dict["USE_DEBUG_TOOLBAR"]:
-            mw_list.insert(0, "debug_toolbar.middleware.DebugToolbarMiddleware")
-        if self.use_cache_middleware:
-            mw_list.insert(0, "django.middleware.cache.UpdateCacheMiddleware")
-            mw_list.append("django.middleware.cache.FetchFromCacheMiddleware")
+            front.append("debug_toolbar.middleware.DebugToolbarMiddleware")
         if self.use_cache_middleware:
-            mw_list.insert(0, "django.middleware.cache.UpdateCacheMiddleware")
+            front.append("django.middleware.cache.UpdateCacheMiddleware")
             mw_list.append("django.middleware.cache.FetchFromCacheMiddleware")
         if settings_dict["USE_PROMETHEUS"]:
-            mw_list.insert(0, "django_prometheus.middleware.PrometheusBeforeMiddleware")
+            front.append("django_prometheus.middleware.PrometheusBeforeMiddleware")
             mw_list.append("django_prometheus.middleware.PrometheusAfterMiddleware")
-        return mw_list
+        front.reverse()
+        front += mw_list
+        return front
 
     def process_third_parties(self, settings_dict):
         """Process third-party middlewares."""
         result = []
-        for k, v in self.common_third_parties.items():
-            package_name = v.partition(".")[0]
+        for k, package_name, v in self.third_party_packages:
             if not settings_dict[k]:
                 continue
             elif not is_package_present(package_name):
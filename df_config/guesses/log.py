@@ -24,11 +24,10 @@ import warnings
 from traceback import extract_stack
 from urllib.parse import urlparse
 
-from django.core.checks import Warning
 from django.core.management import color_style
 from django.utils.log import AdminEmailHandler as BaseAdminEmailHandler
 
-from df_config.checks import settings_check_results
+from df_config.checks import configuration_warning, settings_check_results
 
 
 class ColorizedFormatter(logging.Formatter):
@@ -418,10 +417,9 @@ class LogConfiguration:
                     self.add_handler(logger, "loki", level="DEBUG", **kwargs)
             has_handler = True
         else:
-            warning = Warning(
+            warning = configuration_warning(
                 "The only known schemes for remote logging are syslog, syslog+tcp, loki or lokis.",
                 hint=None,
-                obj="configuration",
                 id="df_config.W005",
             )
             settings_check_results.append(warning)
@@ -575,10 +573,9 @@ class LogConfiguration:
             # noinspection PyUnresolvedReferences,PyPackageRequirements
             import logging_loki
         except ImportError:
-            warning = Warning(
+            warning = configuration_warning(
                 "Unable to import logging_loki (required to log to Loki)",
                 hint=None,
-                obj="configuration",
                 id="df_config.W006",
             )
             settings_check_results.append(warning)
@@ -596,10 +593,9 @@ class LogConfiguration:
             # noinspection PyUnresolvedReferences,PyPackageRequirements
             import systemd.journal
         except ImportError:
-            warning = Warning(
+            warning = configuration_warning(
                 "Unable to import systemd.journal (required to log with journlad)",
                 hint=None,
-                obj="configuration",
                 id="df_config.W007",
             )
             settings_check_results.append(warning)
@@ -616,10 +612,9 @@ class LogConfiguration:
         log_directory = os.path.normpath(self.log_directory)
         if not os.path.isdir(log_directory):
             if not self.log_directory_warning:
-                warning = Warning(
+                warning = configuration_warning(
                     f"Missing directory '{log_directory}'.",
                     hint=None,
-                    obj="configuration",
                     id="df_config.W008",
                 )
                 settings_check_results.append(warning)
@@ -636,10 +631,9 @@ class LogConfiguration:
             ):  # but if this file did not exist, we remove it to avoid lot of empty log files...
                 os.remove(log_filename)
         except PermissionError:
-            warning_ = Warning(
+            warning_ = configuration_warning(
                 f"Unable to write logs in '{log_directory}' (unsufficient rights?).",
                 hint=None,
-                obj="configuration",
                 id="df_config.W009",
             )
             settings_check_results.append(warning_)
@@ -22,13 +22,16 @@ from typing import Dict, Iterable, List, Set
 from urllib.parse import urlparse
 
 # noinspection PyPackageRequirements
-from django.core.checks import Warning
 from django.core.exceptions import ImproperlyConfigured
 
 # noinspection PyPackageRequirements
 from django.utils.crypto import get_random_string
 
-from df_config.checks import missing_package, settings_check_results
+from df_config.checks import (
+    configuration_warning,
+    missing_package,
+    settings_check_results,
+)
 from df_config.config.dynamic_settings import AutocreateFileContent
 from df_config.utils import is_package_present
 
@@ -412,9 +415,8 @@ def use_sentry(settings_dict: Dict) -> bool:
         return False
     if not is_package_present("sentry_sdk"):
         settings_check_results.append(
-            Warning(
+            configuration_warning(
                 "sentry_sdk must be installed.",
-                obj="configuration",
                 hint="Install sentry_sdk with 'pip install sentry-sdk'.",
                 id="df_config.W010",
             )
@@ -20,6 +20,7 @@ import mimetypes
 import os
 import re
 from email.utils import mktime_tz, parsedate_tz
+from functools import lru_cache
 from importlib import metadata
 from importlib.util import find_spec
 from typing import Iterable, Optional, Set, Tuple
@@ -55,8 +56,12 @@ def ensure_dir(path, parent=True):
     return path
 
 
+@lru_cache(maxsize=None)
 def is_package_present(package_name):
-    """Return True is the `package_name` package is present in your current Python environment."""
+    """Return True is the `package_name` package is present in your current Python environment.
+
+    The result is cached, since installed packages do not change during the life of the process.
+    """
     return find_spec(package_name) is not None
 
 
@@ -0,0 +1,170 @@
+# ##############################################################################
+#  This file is part of df_config                                              #
+#                                                                              #
+#  Copyright (C) 2020 Matthieu Gallet <df_config@19pouces.net>                    #
+#  All Rights Reserved                                                         #
+#                                                                              #
+#  You may use, distribute and modify this code under the                      #
+#  terms of the (BSD-like) CeCILL-B license.                                   #
+#                                                                              #
+#  You should have received a copy of the CeCILL-B license with                #
+#  this file. If not, please visit:                                            #
+#  https://cecill.info/licences/Licence_CeCILL-B_V1-en.txt (English)           #
+#  or https://cecill.info/licences/Licence_CeCILL-B_V1-fr.txt (French)         #
+#                                                                              #
+# ##############################################################################
+import tempfile
+from importlib.metadata import version
+from unittest import TestCase, mock
+
+from df_config.checks import settings_check_results
+from df_config.guesses.apps import (
+    InstalledApps,
+    Middlewares,
+    allauth_provider_apps,
+    distribution_version,
+    is_csp_app_required,
+)
+
+
+class TestFunctions(TestCase):
+    def test_distribution_version(self):
+        self.assertEqual(version("django"), distribution_version("django"))
+        self.assertIsNone(distribution_version("df-config-missing-distribution"))
+
+    def test_is_csp_app_required(self):
+        for csp_version, expected in (("3.8", False), ("4.0", True), (None, False)):
+            is_csp_app_required.cache_clear()
+            with mock.patch(
+                "df_config.guesses.apps.distribution_version", return_value=csp_version
+            ):
+                self.assertEqual(expected, is_csp_app_required())
+        is_csp_app_required.cache_clear()
+
+    def test_allauth_provider_apps(self):
+        with tempfile.NamedTemporaryFile() as fd:
+            fd.write(
+                b"[github]\ndjango_app = allauth.socialaccount.providers.github\n"
+                b"[other]\nname = other\n"
+            )
+            fd.flush()
+            self.assertEqual(
+                ["allauth.socialaccount.providers.github"],
+                allauth_provider_apps({"ALLAUTH_APPLICATIONS_CONFIG": fd.name}),
+            )
+        self.assertEqual(
+            [], allauth_provider_apps({"ALLAUTH_APPLICATIONS_CONFIG": fd.name})
+        )
+
+
+class TestInstalledApps(TestCase):
+    def test_process_third_parties(self):
+        settings_dict = {k: False for k, v in InstalledApps.common_third_parties}
+        settings_dict["USE_PIPELINE"] = True
+        settings_dict["USE_PROMETHEUS"] = True
+        with mock.patch("df_config.guesses.apps.is_package_present", return_value=True):
+            result = InstalledApps().process_third_parties(settings_dict)
+        self.assertEqual(["pipeline", "django_prometheus"], result)
+
+    def test_call(self):
+        settings_dict = {k: False for k in InstalledApps.required_settings}
+        settings_dict["SESSION_ENGINE"] = "django.contrib.sessions.backends.db"
+        installed_apps = InstalledApps()
+        result = installed_apps(settings_dict)
+        self.assertEqual(result, installed_apps(settings_dict))
+        self.assertEqual(1, result.count("django.contrib.sessions"))
+        self.assertEqual(1, len(InstalledApps.default_apps))
+
+    def test_process_django_allauth(self):
+        installed_apps = InstalledApps()
+        installed_apps.social_apps = {"allauth.socialaccount.providers.github"}
+        settings_dict = {
+            "USE_ALL_AUTH": True,
+            "ALLAUTH_PROVIDER_APPS": [
+                "allauth.socialaccount.providers.github",
+                "allauth.socialaccount.providers.unknown",
+            ],
+        }
+        with mock.patch(
+            "df_config.guesses.apps.distribution_version", return_value="65.0"
+        ):
+            result = installed_apps.process_django_allauth(settings_dict)
+        self.assertIn("allauth.socialaccount", result)
+        self.assertIn("allauth.socialaccount.providers.github", result)
+        self.assertNotIn("allauth.socialaccount.providers.unknown", result)
+
+
+class TestMiddlewares(TestCase):
+    settings_dict = {
+        "DF_MIDDLEWARE": [],
+        "INSTALLED_APPS": [],
+        "USE_ALL_AUTH": False,
+        "USE_CORS_HEADER": False,
+        "USE_CSP": False,
+        "USE_DEBUG_TOOLBAR": False,
+        "USE_PROMETHEUS": False,
+        "USE_WEBSOCKETS": False,
+        "USE_WHITENOISE": True,
+    }
+
+    def setUp(self):
+        self.checks = list(settings_check_results)
+
+    def tearDown(self):
+        settings_check_results[:] = self.checks
+
+    def test_missing_package(self):
+        middlewares = Middlewares()
+        count = len(settings_check_results)
+        with mock.patch(
+            "df_config.guesses.apps.is_package_present", return_value=False
+        ):
+            result = middlewares(self.settings_dict)
+        self.assertNotIn("whitenoise.middleware.WhiteNoiseMiddleware", result)
+        self.assertEqual(count + 1, len(settings_check_results))
+        self.assertEqual("df_config.W001", settings_check_results[-1].id)
+        with mock.patch("df_config.guesses.apps.is_package_present", return_value=True):
+            result = middlewares({**self.settings_dict, "USE_PROMETHEUS": True})
+        self.assertIn("whitenoise.middleware.WhiteNoiseMiddleware", result)
+        self.assertEqual(
+            "django_prometheus.middleware.PrometheusBeforeMiddleware", result[0]
+        )
+
+    def test_cache_middleware(self):
+        result = Middlewares()(self.settings_dict)
+        self.assertEqual("django.middleware.cache.UpdateCacheMiddleware", result[0])
+        self.assertEqual("django.middleware.cache.FetchFromCacheMiddleware", result[-1])
+        self.assertEqual(1, result.count(result[0]))
+        self.assertEqual(1, result.count(result[-1]))
+
+    def test_order(self):
+        settings_dict = {
+            **self.settings_dict,
+            "USE_DEBUG_TOOLBAR": True,
+            "USE_PROMETHEUS": True,
+            "USE_WHITENOISE": False,
+        }
+        result = Middlewares()(settings_dict)
+        self.assertEqual(
+            [
+                "django_prometheus.middleware.PrometheusBeforeMiddleware",
+                "django.middleware.cache.UpdateCacheMiddleware",
+                "debug_toolbar.middleware.DebugToolbarMiddleware",
+                "django.contrib.sessions.middleware.SessionMiddleware",
+            ],
+            result[:4],
+        )
+        self.assertEqual(
+            [
+                "django.middleware.cache.FetchFromCacheMiddleware",
+                "django_prometheus.middleware.PrometheusAfterMiddleware",
+            ],
+            result[-2:],
+        )
+
+    def test_instance_options(self):
+        middlewares = Middlewares()
+        middlewares.use_cache_middleware = False
+        result = middlewares(self.settings_dict)
+        self.assertNotIn("django.middleware.cache.UpdateCacheMiddleware", result)
+        self.assertNotIn("django.middleware.cache.FetchFromCacheMiddleware", result)
@@ -0,0 +1,35 @@
+# ##############################################################################
+#  This file is part of df_config                                              #
+#                                                                              #
+#  Copyright (C) 2020 Matthieu Gallet <df_config@19pouces.net>                    #
+#  All Rights Reserved                                                         #
+#                                                                              #
+#  You may use, distribute and modify this code under the                      #
+#  terms of the (BSD-like) CeCILL-B license.                                   #
+#                                                                              #
+#  You should have received a copy of the CeCILL-B license with                #
+#  this file. If not, please visit:                                            #
+#  https://cecill.info/licences/Licence_CeCILL-B_V1-en.txt (English)           #
+#  or https://cecill.info/licences/Licence_CeCILL-B_V1-fr.txt (French)         #
+#                                                                              #
+# ##############################################################################
+from django.test import SimpleTestCase, override_settings
+
+from df_config.context_processors import config
+
+
+class TestContextProcessors(SimpleTestCase):
+    @override_settings(
+        ADMIN_EMAIL="admin@example.org",
+        DF_PROJECT_NAME="project",
+        DF_PROJECT_VERSION="1.0",
+        SERVER_BASE_URL="http://localhost/",
+        SERVER_NAME="localhost",
+    )
+    def test_config(self):
+        context = config(None)
+        self.assertEqual("admin@example.org", context["ADMIN_EMAIL"])
+        self.assertIs(context, config(None))
+        with self.settings(ADMIN_EMAIL="root@example.org"):
+            self.assertEqual("root@example.org", config(None)["ADMIN_EMAIL"])
+        self.assertEqual("admin@example.org", config(None)["ADMIN_EMAIL"])
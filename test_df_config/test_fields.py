@@ -77,10 +77,14 @@ class TestFunctions(TestCase):
             r_1 = guess_relative_path(tested_path)
             ensure_dir(tested_path, parent=False)
             r_2 = guess_relative_path(tested_path)
+            r_3 = guess_relative_path(dirname)
+            r_4 = guess_relative_path(dirname + "2")
 
         os.chdir(cwd)
         self.assertEqual("./test1/test2", r_1)
         self.assertEqual("./test1/test2", r_2)
+        self.assertEqual(".", r_3)
+        self.assertEqual(dirname + "2", r_4)
         self.assertEqual("", guess_relative_path(None))
         self.assertEqual("", guess_relative_path(""))
 
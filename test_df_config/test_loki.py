@@ -0,0 +1,32 @@
+# ##############################################################################
+#  This file is part of df_config                                              #
+#                                                                              #
+#  Copyright (C) 2020 Matthieu Gallet <df_config@19pouces.net>                    #
+#  All Rights Reserved                                                         #
+#                                                                              #
+#  You may use, distribute and modify this code under the                      #
+#  terms of the (BSD-like) CeCILL-B license.                                   #
+#                                                                              #
+#  You should have received a copy of the CeCILL-B license with                #
+#  this file. If not, please visit:                                            #
+#  https://cecill.info/licences/Licence_CeCILL-B_V1-en.txt (English)           #
+#  or https://cecill.info/licences/Licence_CeCILL-B_V1-fr.txt (French)         #
+#                                                                              #
+# ##############################################################################
+from django.test import SimpleTestCase, override_settings
+
+from df_config.extra.loki import get_loki_tags
+
+
+class TestLoki(SimpleTestCase):
+    def tearDown(self):
+        get_loki_tags.cache_clear()
+
+    @override_settings(SERVER_NAME="server", CURRENT_COMMAND_NAME="worker")
+    def test_get_loki_tags(self):
+        get_loki_tags.cache_clear()
+        tags = get_loki_tags()
+        self.assertEqual("server", tags["application"])
+        self.assertEqual("worker", tags["command"])
+        self.assertEqual("django", tags["log_source"])
+        self.assertIs(tags, get_loki_tags())
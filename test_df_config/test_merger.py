@@ -106,6 +106,14 @@ class TestSettingMerger(TestCase):
             merger.settings,
         )
 
+    def test_parse_escaped(self):
+        merger = SettingMerger(
+            None,
+            [DictProvider({"X": 2, "Y": "{{X}}-{X:>3}", "Z": "}}"}, name="1")],
+        )
+        merger.process()
+        self.assertEqual({"X": 2, "Y": "{X}-  2", "Z": "}"}, merger.settings)
+
     def test_loop(self):
         merger = SettingMerger(
             None,
@@ -196,6 +204,16 @@ class TestSettingMerger(TestCase):
         merger.process()
         self.assertEqual({"X": 1, "Y": {"1": "1"}}, merger.settings)
 
+    def test_complex_settings_dict_error(self):
+        values = {"a": "a", "b": "{X}", "c": "c"}
+        merger = SettingMerger(
+            None,
+            [DictProvider({"X": "{Y}", "Y": "{X}", "Z": values}, name="d1")],
+        )
+        merger.load_raw_settings()
+        self.assertRaises(ValueError, merger.get_setting_value, "Z")
+        self.assertEqual({"a": "a", "b": "{X}", "c": "c"}, values)
+
     def test_complex_settings_ordereddict(self):
         merger = SettingMerger(
             None,
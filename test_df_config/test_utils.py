@@ -49,6 +49,12 @@ class TestIsPackagePresent(TestCase):
         self.assertTrue(is_package_present("df_config"))
         self.assertFalse(is_package_present("flask2"))
 
+    def test_is_package_present_cached(self):
+        is_package_present.cache_clear()
+        is_package_present("df_config")
+        is_package_present("df_config")
+        self.assertEqual(1, is_package_present.cache_info().hits)
+
 
 class TestEnsureDir(TestCase):
     def test_ensure_dir(self):
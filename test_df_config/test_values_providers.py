@@ -74,6 +74,34 @@ class TestEnvironmentConfigProvider(TestCase):
             )
             self.assertEqual(False, v)
 
+    def test_get_values(self):
+        provider = EnvironmentConfigProvider(prefix="DF_")
+        field_1 = BooleanConfigField("test.test", "UNITTEST", default=True)
+        field_2 = BooleanConfigField("test.test2", "UNITTEST_2", default=True)
+        with EnvPatch(DF_UNITTEST="off"):
+            self.assertEqual({field_1: False}, provider.get_values([field_1, field_2]))
+
+    def test_refresh(self):
+        provider = EnvironmentConfigProvider(prefix="DF_")
+        field = BooleanConfigField("test.test", "UNITTEST", default=True)
+        with EnvPatch(DF_UNITTEST="off"):
+            self.assertEqual(False, provider.get_value(field))
+        self.assertEqual(False, provider.get_value(field))
+        with EnvPatch(DF_UNITTEST="on"):
+            self.assertEqual(False, provider.get_value(field))
+            provider.refresh()
+            self.assertEqual(True, provider.get_value(field))
+
+    def test_get_key(self):
+        provider = EnvironmentConfigProvider(prefix="DF_")
+        field = BooleanConfigField("test.test", "UNITTEST")
+        self.assertEqual("DF_UNITTEST", provider.get_key(field))
+        self.assertIs(provider.get_key(field), provider.get_key(field))
+        field = BooleanConfigField("test.test", "UNITTEST", env_name="OTHER")
+        self.assertEqual("OTHER", provider.get_key(field))
+        field = BooleanConfigField("test.test", "UNITTEST", env_name=None)
+        self.assertIsNone(provider.get_key(field))
+
     def test_get_extra_settings(self):
         provider = EnvironmentConfigProvider(prefix="DF_")
         print(provider.get_extra_settings())
@@ -148,6 +176,16 @@ class TestIniConfigProvider(TestCase):
             "[test]\ntest = true\ntest2 = $KEY {VALUE} 'SPECIAL \"CHARS\n\n", content
         )
 
+    def test_to_str_sections(self):
+        provider = IniConfigProvider()
+        self.assertEqual("", provider.to_str())
+        provider.set_value(CharConfigField("a.x", "UNITTEST", default="1\n2"))
+        provider.set_value(CharConfigField("b.y", "UNITTEST2", default="50%%"))
+        provider.set_value(CharConfigField("a.z", "UNITTEST3", default="3"))
+        self.assertEqual(
+            "[a]\nx = 1\n\t2\nz = 3\n\n[b]\ny = 50%%\n\n", provider.to_str()
+        )
+
     def test_get_value(self):
         with tempfile.NamedTemporaryFile() as fd:
             fd.write(b"[test]\ntest = off\n")
@@ -158,6 +196,27 @@ class TestIniConfigProvider(TestCase):
             )
             self.assertEqual(False, v)
 
+    def test_get_value_interpolation(self):
+        with tempfile.NamedTemporaryFile() as fd:
+            fd.write(b"[DEFAULT]\nroot = /srv\n[test]\nTest = %(root)s/data\n")
+            fd.flush()
+            provider = IniConfigProvider(config_file=fd.name)
+            field = CharConfigField("test.test", "UNITTEST")
+            self.assertTrue(provider.has_value(field))
+            self.assertEqual("/srv/data", provider.get_value(field))
+            self.assertEqual(
+                "/srv", provider.get_value(CharConfigField("test.root", "UNITTEST"))
+            )
+            provider.set_value(CharConfigField("test.test", "UNITTEST", default="x"))
+            self.assertEqual("x", provider.get_value(field))
+
+    def test_set_value_invalid(self):
+        provider = IniConfigProvider()
+        field = CharConfigField("test.test", "UNITTEST", default="50%")
+        self.assertRaises(ValueError, provider.set_value, field)
+        provider.set_value(CharConfigField("test.test", "UNITTEST", default="a"))
+        self.assertEqual("a", provider.parser.get("test", "test"))
+
     def test_get_extra_settings(self):
         with tempfile.NamedTemporaryFile() as fd:
             fd.write(b"[test]\ntest = off\n")
@@ -207,6 +266,12 @@ class TestPythonModuleProvider(TestCase):
         )
         self.assertEqual(False, v)
 
+    def test_get_values(self):
+        provider = self.get_provider()
+        field_1 = BooleanConfigField("test.test", "UNITTEST_3", default=True)
+        field_2 = BooleanConfigField("test.test2", "UNITTEST_2", default=True)
+        self.assertEqual({field_1: False}, provider.get_values([field_1, field_2]))
+
     def test_get_extra_settings(self):
         provider = self.get_provider()
         settings = {k: v for k, v in provider.get_extra_settings()}